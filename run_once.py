@@ -6,8 +6,13 @@ import logging
 import warnings
 from pathlib import Path
 
-# Suppress urllib3 OpenSSL warning on macOS
-warnings.filterwarnings('ignore', message='.*urllib3.*OpenSSL.*', category=UserWarning)
+# Suppress urllib3 OpenSSL warning on macOS (urllib3 2.x emits it on import)
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    import urllib3
+_NotOpenSSLWarning = getattr(urllib3.exceptions, 'NotOpenSSLWarning', None)
+if _NotOpenSSLWarning:
+    warnings.filterwarnings('ignore', category=_NotOpenSSLWarning)
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -25,15 +30,22 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Quiet urllib3 connection-pool noise (e.g. during Selenium shutdown)
+logging.getLogger('urllib3').setLevel(logging.ERROR)
+
 
 async def run_once():
     """Run parsing task once."""
     # Initialize components
     db = Database(db_path=config.database.db_path)
+    
+    # One warm browser per concurrently fetched tag
     parser = BandcampParser(
         user_agent=config.parser.user_agent,
-        request_delay=config.parser.request_delay
+        request_delay=config.parser.request_delay,
+        pool_size=max(1, config.parser.concurrency)
     )
+    
     telegram = TelegramBot(
         bot_token=config.telegram.bot_token,
         chat_id=config.telegram.chat_id,
@@ -45,30 +57,42 @@ async def run_once():
     if config.blacklist_tags:
         logger.info(f"Blacklist: {', '.join(config.blacklist_tags)}")
     
+    blacklisted = 0
+    sent = 0
+    
+    # Open the Telegram connection pool, so close() below shuts it down
+    try:
+        await telegram.initialize()
+    except Exception as e:
+        logger.warning(f"Could not initialize Telegram bot: {e}")
+    
     try:
+        # Fetch all tags concurrently, then process them in order
+        unique_tags = list(dict.fromkeys([*config.blacklist_tags, *config.tags]))
+        fetched = dict(zip(
+            unique_tags,
+            await asyncio.gather(*(parser.get_releases_by_tag_async(tag) for tag in unique_tags))
+        ))
+        
+        # URLs already handled, primed from the database in one lookup
+        seen_urls = db.existing_urls(
+            r.url for releases in fetched.values() for r in releases
+        )
+        
         # Process blacklist tags first
-        blacklisted = 0
         if config.blacklist_tags:
             logger.info("=" * 50)
             logger.info("Processing blacklist tags...")
             
             for tag in config.blacklist_tags:
                 logger.info(f"Blacklist tag: {tag}")
-                releases = parser.get_releases_by_tag(tag)
+                new = [r for r in fetched[tag] if r.url not in seen_urls]
+                seen_urls.update(r.url for r in new)
                 
-                for release in releases:
-                    if db.exists(release.url):
-                        continue
-                    
-                    if db.add(
-                        release_url=release.url,
-                        title=release.title,
-                        artist=release.artist,
-                        tags=release.tags,
-                        cover_url=release.cover_url
-                    ):
-                        db.mark_sent(release.url)
-                        blacklisted += 1
+                blacklisted += db.add_many_sent(
+                    (r.url, r.title, r.artist, ",".join(r.tags) if r.tags else None, r.cover_url)
+                    for r in new
+                )
             
             logger.info(f"Blacklisted {blacklisted} releases")
         
@@ -76,30 +100,19 @@ async def run_once():
         logger.info("=" * 50)
         logger.info("Processing main tags...")
         
-        sent = 0
+        # Record each delivered release right away, so a crash mid-batch can't resend it
+        def store_sent(release):
+            db.add_sent(release.url, release.title, release.artist, release.tags, release.cover_url)
+            logger.info(f"Sent: {release.title} by {release.artist}")
         
         for tag in config.tags:
             logger.info(f"Processing tag: {tag}")
-            releases = parser.get_releases_by_tag(tag)
+            new = [r for r in fetched[tag] if r.url not in seen_urls]
+            seen_urls.update(r.url for r in new)
             
-            for release in releases:
-                if db.exists(release.url):
-                    continue
-                
-                success = await telegram.send_release(release)
-                
-                if success:
-                    db.add(
-                        release_url=release.url,
-                        title=release.title,
-                        artist=release.artist,
-                        tags=release.tags,
-                        cover_url=release.cover_url
-                    )
-                    db.mark_sent(release.url)
-                    sent += 1
-                    logger.info(f"Sent: {release.title} by {release.artist}")
-                    await asyncio.sleep(2)
+            # Send concurrently (TelegramBot enforces rate limits), storing each as it goes out
+            results = await telegram.send_releases(new, on_sent=store_sent)
+            sent += sum(results)
         
         # Summary
         logger.info(f"Sent {sent} new releases")
@@ -117,14 +130,23 @@ async def run_once():
         await telegram.send_message(f"❌ Error: {e}")
     
     finally:
-        # Cleanup - suppress urllib3 warnings during shutdown
-        logging.getLogger('urllib3').setLevel(logging.ERROR)
-        if parser.driver:
+        # Prune old records only when this run wrote something
+        if (sent > 0 or blacklisted > 0) and config.database.cleanup_days > 0:
             try:
-                parser.driver.quit()
-                parser.driver = None
-            except Exception:
-                pass
+                deleted = db.cleanup(config.database.cleanup_days)
+                if deleted > Database.VACUUM_THRESHOLD:
+                    db.vacuum()
+            except Exception as e:
+                logger.warning(f"Database cleanup failed: {e}")
+        db.close()
+        
+        try:
+            await telegram.close()
+        except Exception:
+            pass
+        
+        await parser.aclose()
+        parser.close()
 
 
 if __name__ == "__main__":
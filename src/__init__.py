@@ -1,22 +1,36 @@
 """Bandcamp Parser Bot - Source modules."""
 
+import importlib
+
+# Cheap to import, and a lazy `config` would be shadowed by the src.config
+# submodule as soon as anything imports it
 from src.config import config, Config
-from src.database import Database, DatabaseStats
-from src.parser import BandcampParser, Release
-from src.telegram_bot import TelegramBot
-from src.scheduler import TaskScheduler
-from src.main import BandcampBot
-
-__all__ = [
-    'config',
-    'Config',
-    'Database',
-    'DatabaseStats',
-    'BandcampParser',
-    'Release',
-    'TelegramBot',
-    'TaskScheduler',
-    'BandcampBot',
-]
+
+# Heavy public names, imported from their modules on first access so that
+# e.g. `from src.config import config` doesn't pull in Selenium or Telegram
+_EXPORTS = {
+    'Database': 'src.database',
+    'DatabaseStats': 'src.database',
+    'BandcampParser': 'src.parser',
+    'Release': 'src.parser',
+    'TelegramBot': 'src.telegram_bot',
+    'TaskScheduler': 'src.scheduler',
+    'BandcampBot': 'src.main',
+}
+
+__all__ = ['config', 'Config', *_EXPORTS]
 
 __version__ = '2.0.0'
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -1,32 +1,40 @@
 """Configuration management module."""
 import os
+import json
 import yaml
 import logging
 from pathlib import Path
 from dataclasses import dataclass
+from functools import cached_property
 from dotenv import load_dotenv
 from typing import List, Dict, Any, Optional
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleConfig:
     """Schedule configuration."""
     times: List[str]
     timezone: str
 
 
-@dataclass  
+@dataclass(slots=True)
 class ParserConfig:
     """Parser configuration."""
     request_delay: float
     user_agent: str
+    concurrency: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig:
     """Telegram configuration."""
     bot_token: str
@@ -34,7 +42,7 @@ class TelegramConfig:
     max_description_length: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration."""
     db_path: str
@@ -50,6 +58,7 @@ class Config:
     DEFAULT_TAGS = ["punk", "hardcore"]
     DEFAULT_REQUEST_DELAY = 1.5
     DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    DEFAULT_CONCURRENCY = 2
     DEFAULT_MAX_DESC_LENGTH = 0
     DEFAULT_DB_PATH = "bandcamp_releases.db"
     DEFAULT_CLEANUP_DAYS = 90
@@ -61,12 +70,29 @@ class Config:
         self._validate_env_vars()
         
     def _load_yaml(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file (or its up-to-date JSON cache)."""
         if not self._config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self._config_path}")
         
+        cache_path = self._config_path.with_suffix(self._config_path.suffix + '.json')
+        # Cache is valid only for this exact file: copies may keep an older mtime
+        stat = self._config_path.stat()
+        source = [stat.st_mtime_ns, stat.st_size]
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if isinstance(cached, dict) and cached.get('source') == source:
+                logger.debug(f"Loaded configuration from cache {cache_path}")
+                return cached['config']
+        except (OSError, ValueError, KeyError):
+            pass
+        
         with open(self._config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+        
+        try:
+            cache_path.write_text(json.dumps({'source': source, 'config': config}), encoding='utf-8')
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
         
         logger.debug(f"Loaded configuration from {self._config_path}")
         return config
@@ -90,7 +116,7 @@ class Config:
                 return default
         return value
     
-    @property
+    @cached_property
     def schedule(self) -> ScheduleConfig:
         """Get schedule configuration."""
         return ScheduleConfig(
@@ -98,25 +124,26 @@ class Config:
             timezone=self._get("schedule", "timezone", default=self.DEFAULT_TIMEZONE)
         )
     
-    @property
+    @cached_property
     def tags(self) -> List[str]:
         """Get list of tags to monitor."""
         return self._get("tags", default=self.DEFAULT_TAGS)
     
-    @property
+    @cached_property
     def blacklist_tags(self) -> List[str]:
         """Get list of blacklist tags."""
         return self._get("blacklist_tags", default=[])
     
-    @property
+    @cached_property
     def parser(self) -> ParserConfig:
         """Get parser configuration."""
         return ParserConfig(
             request_delay=self._get("parser", "request_delay", default=self.DEFAULT_REQUEST_DELAY),
-            user_agent=self._get("parser", "user_agent", default=self.DEFAULT_USER_AGENT)
+            user_agent=self._get("parser", "user_agent", default=self.DEFAULT_USER_AGENT),
+            concurrency=self._get("parser", "concurrency", default=self.DEFAULT_CONCURRENCY)
         )
     
-    @property
+    @cached_property
     def telegram(self) -> TelegramConfig:
         """Get Telegram configuration."""
         return TelegramConfig(
@@ -125,7 +152,7 @@ class Config:
             max_description_length=self._get("telegram", "max_description_length", default=self.DEFAULT_MAX_DESC_LENGTH)
         )
     
-    @property
+    @cached_property
     def database(self) -> DatabaseConfig:
         """Get database configuration."""
         return DatabaseConfig(
@@ -134,43 +161,44 @@ class Config:
         )
     
     # Legacy compatibility properties
-    @property
+    @cached_property
     def schedule_times(self) -> List[str]:
         return self.schedule.times
     
-    @property
+    @cached_property
     def schedule_timezone(self) -> str:
         return self.schedule.timezone
     
-    @property
+    @cached_property
     def telegram_bot_token(self) -> str:
         return self.telegram.bot_token
     
-    @property
+    @cached_property
     def telegram_chat_id(self) -> str:
         return self.telegram.chat_id
     
-    @property
+    @cached_property
     def parser_config(self) -> Dict[str, Any]:
         """Legacy: Get parser config as dict."""
         p = self.parser
         return {
             "request_delay": p.request_delay,
-            "user_agent": p.user_agent
+            "user_agent": p.user_agent,
+            "concurrency": p.concurrency
         }
     
-    @property
+    @cached_property
     def telegram_config(self) -> Dict[str, Any]:
         """Legacy: Get telegram config as dict."""
         return {"max_description_length": self.telegram.max_description_length}
     
-    @property
+    @cached_property
     def database_config(self) -> Dict[str, Any]:
         """Legacy: Get database config as dict."""
         d = self.database
         return {"db_path": d.db_path, "cleanup_days": d.cleanup_days}
     
-    @property
+    @cached_property
     def _config(self) -> Dict[str, Any]:
         """Legacy: Raw config access."""
         return self._raw_config
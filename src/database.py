@@ -1,16 +1,17 @@
 """Database module for storing and tracking releases."""
 import sqlite3
 import logging
+import threading
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
 from pathlib import Path
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseRecord:
     """Database release record."""
     id: int
@@ -22,9 +23,11 @@ class ReleaseRecord:
     description: Optional[str]
     created_at: datetime
     sent_at: Optional[datetime]
+    retry_count: int = 0
+    next_retry_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseStats:
     """Database statistics."""
     total: int
@@ -48,56 +51,180 @@ class Database:
             cover_url TEXT,
             description TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            sent_at TIMESTAMP
+            sent_at TIMESTAMP,
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            next_retry_at TIMESTAMP
         )
     """
     
+    # Columns added after the initial schema: (name, definition)
+    _MIGRATIONS = [
+        ("retry_count", "INTEGER NOT NULL DEFAULT 0"),
+        ("next_retry_at", "TIMESTAMP"),
+    ]
+    
+    # SQLite caps the number of bound parameters per statement
+    _MAX_PARAMS = 500
+    
+    # Deleted rows after which cleanup is followed by VACUUM
+    VACUUM_THRESHOLD = 1000
+    
+    # release_url is covered by the implicit index of its UNIQUE constraint
     _INDEXES = [
-        "CREATE INDEX IF NOT EXISTS idx_release_url ON releases(release_url)",
         "CREATE INDEX IF NOT EXISTS idx_created_at ON releases(created_at)",
         "CREATE INDEX IF NOT EXISTS idx_sent_at ON releases(sent_at)",
+        # Pending rows only, in retry order: stays tiny however large the table grows
+        "CREATE INDEX IF NOT EXISTS idx_unsent ON releases(created_at) WHERE sent_at IS NULL",
+    ]
+    
+    # Column order matches ReleaseRecord fields
+    _RECORD_COLUMNS = (
+        "id, release_url, title, artist, tags, cover_url, "
+        "description, created_at, sent_at, retry_count, next_retry_at"
+    )
+    
+    # Statements are kept as constants so the connection's statement cache
+    # sees identical SQL text on every call
+    _SQL_EXISTS = "SELECT 1 FROM releases WHERE release_url = ? LIMIT 1"
+    _SQL_ALL_URLS = "SELECT release_url FROM releases"
+    _SQL_EXISTING_URLS = "SELECT release_url FROM releases WHERE release_url IN ({placeholders})"
+    _SQL_INSERT = """INSERT OR IGNORE INTO releases 
+        (release_url, title, artist, tags, cover_url, description)
+        VALUES (?, ?, ?, ?, ?, ?)"""
+    _SQL_INSERT_SENT = """INSERT OR IGNORE INTO releases 
+        (release_url, title, artist, tags, cover_url, description, sent_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)"""
+    _SQL_INSERT_MANY = """INSERT OR IGNORE INTO releases 
+        (release_url, title, artist, tags, cover_url)
+        VALUES (?, ?, ?, ?, ?)"""
+    _SQL_INSERT_MANY_SENT = """INSERT OR IGNORE INTO releases 
+        (release_url, title, artist, tags, cover_url, sent_at)
+        VALUES (?, ?, ?, ?, ?, ?)"""
+    _SQL_MARK_SENT = "UPDATE releases SET sent_at = ? WHERE release_url = ?"
+    _SQL_SCHEDULE_RETRY = """UPDATE releases 
+        SET retry_count = retry_count + 1, next_retry_at = ? 
+        WHERE release_url = ?"""
+    _SQL_NEXT_RETRY = """SELECT COUNT(*), COUNT(next_retry_at), MIN(next_retry_at) 
+        FROM releases WHERE sent_at IS NULL"""
+    _SQL_CLEANUP = "DELETE FROM releases WHERE created_at < ?"
+    _SQL_STATS = "SELECT COUNT(*), COUNT(sent_at) FROM releases"
+    _SQL_RECENT = f"""SELECT {_RECORD_COLUMNS} FROM releases 
+        ORDER BY created_at DESC 
+        LIMIT ?"""
+    _SQL_UNSENT = f"""SELECT {_RECORD_COLUMNS} FROM releases 
+        WHERE sent_at IS NULL AND (next_retry_at IS NULL OR next_retry_at <= ?)
+        ORDER BY created_at ASC"""
+    
+    _PRAGMAS = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
     ]
     
     def __init__(self, db_path: str = "bandcamp_releases.db"):
         """Initialize database connection."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # Autocommit: single statements commit on their own, batches use _transaction()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
         self._init_database()
     
     def _init_database(self) -> None:
-        """Initialize database schema."""
+        """Initialize connection settings and database schema."""
         with self._connection() as conn:
             cursor = conn.cursor()
+            for pragma_sql in self._PRAGMAS:
+                cursor.execute(pragma_sql)
             cursor.execute(self._SCHEMA)
+            self._migrate(cursor)
+            cursor.execute("DROP INDEX IF EXISTS idx_release_url")
             for index_sql in self._INDEXES:
                 cursor.execute(index_sql)
-            conn.commit()
         logger.info(f"Database initialized at {self.db_path}")
     
+    def _migrate(self, cursor: sqlite3.Cursor) -> None:
+        """Add columns missing from databases created by older versions."""
+        cursor.execute("PRAGMA table_info(releases)")
+        columns = {row["name"] for row in cursor.fetchall()}
+        for name, definition in self._MIGRATIONS:
+            if name not in columns:
+                cursor.execute(f"ALTER TABLE releases ADD COLUMN {name} {definition}")
+                logger.info(f"Added column releases.{name}")
+    
     @contextmanager
     def _connection(self):
-        """Get database connection with context manager."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Get the shared database connection with context manager."""
+        with self._lock:
+            yield self._conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a batch of statements in one explicit write transaction."""
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            # Refresh planner statistics so partial indexes like idx_unsent get picked
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            self._conn.close()
     
     def exists(self, release_url: str) -> bool:
         """Check if release already exists in database."""
         with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT 1 FROM releases WHERE release_url = ? LIMIT 1",
-                (release_url,)
-            )
+            cursor.execute(self._SQL_EXISTS, (release_url,))
             return cursor.fetchone() is not None
     
     # Alias for backwards compatibility
     def release_exists(self, release_url: str) -> bool:
         return self.exists(release_url)
     
+    def get_all_urls(self) -> Set[str]:
+        """Get every stored release URL."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(self._SQL_ALL_URLS)
+            return {url for url, in cursor}
+    
+    def existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Return the subset of given URLs already stored in database."""
+        urls = list(urls)
+        found: Set[str] = set()
+        if not urls:
+            return found
+        
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(urls), self._MAX_PARAMS):
+                chunk = urls[start:start + self._MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    self._SQL_EXISTING_URLS.format(placeholders=placeholders),
+                    chunk
+                )
+                found.update(row["release_url"] for row in cursor.fetchall())
+        return found
+    
     def add(
         self,
         release_url: str,
@@ -108,22 +235,18 @@ class Database:
         description: Optional[str] = None
     ) -> bool:
         """Add new release to database. Returns True if added, False if exists."""
-        if self.exists(release_url):
-            return False
-        
         with self._connection() as conn:
             cursor = conn.cursor()
             tags_str = ",".join(tags) if tags else None
             cursor.execute(
-                """INSERT INTO releases 
-                   (release_url, title, artist, tags, cover_url, description)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+                self._SQL_INSERT,
                 (release_url, title, artist, tags_str, cover_url, description)
             )
-            conn.commit()
+            added = cursor.rowcount == 1
         
-        logger.debug(f"Added release: {title} by {artist}")
-        return True
+        if added and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Added release: {title} by {artist}")
+        return added
     
     # Alias for backwards compatibility
     def add_release(
@@ -137,34 +260,120 @@ class Database:
     ) -> bool:
         return self.add(release_url, title, artist, tags, cover_url, description)
     
-    def mark_sent(self, release_url: str) -> None:
-        """Mark release as sent."""
+    def add_sent(
+        self,
+        release_url: str,
+        title: str,
+        artist: str,
+        tags: Optional[List[str]] = None,
+        cover_url: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> bool:
+        """Add release already marked as sent. Returns True if added, False if exists."""
         with self._connection() as conn:
             cursor = conn.cursor()
+            tags_str = ",".join(tags) if tags else None
             cursor.execute(
-                "UPDATE releases SET sent_at = ? WHERE release_url = ?",
-                (datetime.now(), release_url)
+                self._SQL_INSERT_SENT,
+                (release_url, title, artist, tags_str, cover_url, description, datetime.now())
             )
-            conn.commit()
+            added = cursor.rowcount == 1
+        
+        if added and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Added sent release: {title} by {artist}")
+        return added
+    
+    def _execute_many(self, sql: str, rows: List[tuple]) -> int:
+        """Run one statement for every row in a single transaction. Returns rowcount."""
+        if not rows:
+            return 0
+        
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(sql, rows)
+            return cursor.rowcount
+    
+    def add_many(
+        self,
+        records: Iterable[Tuple[str, str, str, Optional[str], Optional[str]]]
+    ) -> int:
+        """Add unsent releases in one transaction.
+        
+        Records have the same shape as for add_many_sent().
+        Returns count of added rows; existing URLs are ignored.
+        """
+        added = self._execute_many(self._SQL_INSERT_MANY, list(records))
+        logger.debug(f"Added {added} release(s)")
+        return added
+    
+    def add_many_sent(
+        self,
+        records: Iterable[Tuple[str, str, str, Optional[str], Optional[str]]]
+    ) -> int:
+        """Add releases already marked as sent in one transaction.
+        
+        Each record is (release_url, title, artist, tags, cover_url) with tags
+        already serialized as a comma-separated string (or None).
+        Returns count of added rows; existing URLs are ignored.
+        """
+        now = datetime.now()
+        added = self._execute_many(
+            self._SQL_INSERT_MANY_SENT, [(*record, now) for record in records]
+        )
+        logger.debug(f"Added {added} release(s) as sent")
+        return added
+    
+    def mark_sent(self, release_url: str) -> None:
+        """Mark release as sent."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_MARK_SENT, (datetime.now(), release_url))
+    
+    def mark_sent_many(self, release_urls: Iterable[str]) -> int:
+        """Mark several releases as sent in one transaction. Returns count of updated rows."""
+        now = datetime.now()
+        return self._execute_many(self._SQL_MARK_SENT, [(now, url) for url in release_urls])
     
     # Alias for backwards compatibility
     def mark_as_sent(self, release_url: str) -> None:
         self.mark_sent(release_url)
     
+    def schedule_retry(self, release_url: str, next_retry_at: datetime) -> None:
+        """Record a failed send and when the release becomes due again."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_SCHEDULE_RETRY, (next_retry_at, release_url))
+    
+    def schedule_retry_many(self, retries: Iterable[Tuple[str, datetime]]) -> int:
+        """Record several failed sends, as (release_url, next_retry_at), in one transaction."""
+        return self._execute_many(
+            self._SQL_SCHEDULE_RETRY, [(when, url) for url, when in retries]
+        )
+    
+    def next_retry_at(self) -> Optional[datetime]:
+        """Get earliest time an unsent release is due, or None if nothing is pending."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_NEXT_RETRY)
+            pending, scheduled, earliest = cursor.fetchone()
+        
+        if pending == 0:
+            return None
+        if scheduled < pending:
+            # Never-attempted releases are due immediately
+            return datetime.now()
+        return datetime.fromisoformat(earliest)
+    
     def cleanup(self, days: int = 90) -> int:
         """Remove records older than specified days. Returns count of deleted."""
         if days <= 0:
             return 0
         
         cutoff_date = datetime.now() - timedelta(days=days)
-        with self._connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM releases WHERE created_at < ?",
-                (cutoff_date,)
-            )
+            cursor.execute(self._SQL_CLEANUP, (cutoff_date,))
             deleted = cursor.rowcount
-            conn.commit()
         
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} old records")
@@ -174,16 +383,19 @@ class Database:
     def cleanup_old_records(self, days: int = 90) -> None:
         self.cleanup(days)
     
+    def vacuum(self) -> None:
+        """Rebuild database file to reclaim pages freed by deletes."""
+        with self._connection() as conn:
+            conn.execute("VACUUM")
+        logger.info("Database vacuumed")
+    
     def get_stats(self) -> DatabaseStats:
         """Get database statistics."""
         with self._connection() as conn:
             cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) as total FROM releases")
-            total = cursor.fetchone()["total"]
-            
-            cursor.execute("SELECT COUNT(*) as sent FROM releases WHERE sent_at IS NOT NULL")
-            sent = cursor.fetchone()["sent"]
+            # COUNT(sent_at) skips NULLs, so it counts sent releases
+            cursor.execute(self._SQL_STATS)
+            total, sent = cursor.fetchone()
         
         return DatabaseStats(total=total, sent=sent)
     
@@ -192,55 +404,23 @@ class Database:
         stats = self.get_stats()
         return {"total": stats.total, "sent": stats.sent, "pending": stats.pending}
     
+    @staticmethod
+    def _record_factory(cursor: sqlite3.Cursor, row: tuple) -> ReleaseRecord:
+        """Build ReleaseRecord straight from a row selected in _RECORD_COLUMNS order."""
+        return ReleaseRecord(*row)
+    
     def get_recent(self, limit: int = 100) -> List[ReleaseRecord]:
         """Get recent releases."""
         with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """SELECT * FROM releases 
-                   ORDER BY created_at DESC 
-                   LIMIT ?""",
-                (limit,)
-            )
-            rows = cursor.fetchall()
-        
-        return [
-            ReleaseRecord(
-                id=row["id"],
-                release_url=row["release_url"],
-                title=row["title"],
-                artist=row["artist"],
-                tags=row["tags"],
-                cover_url=row["cover_url"],
-                description=row["description"],
-                created_at=row["created_at"],
-                sent_at=row["sent_at"]
-            )
-            for row in rows
-        ]
+            cursor.row_factory = self._record_factory
+            cursor.execute(self._SQL_RECENT, (limit,))
+            return cursor.fetchall()
     
     def get_unsent_releases(self) -> List[ReleaseRecord]:
-        """Get all releases that haven't been sent yet (sent_at IS NULL)."""
+        """Get releases that haven't been sent yet and are due for a retry."""
         with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """SELECT * FROM releases 
-                   WHERE sent_at IS NULL
-                   ORDER BY created_at ASC"""
-            )
-            rows = cursor.fetchall()
-        
-        return [
-            ReleaseRecord(
-                id=row["id"],
-                release_url=row["release_url"],
-                title=row["title"],
-                artist=row["artist"],
-                tags=row["tags"],
-                cover_url=row["cover_url"],
-                description=row["description"],
-                created_at=row["created_at"],
-                sent_at=row["sent_at"]
-            )
-            for row in rows
-        ]
+            cursor.row_factory = self._record_factory
+            cursor.execute(self._SQL_UNSENT, (datetime.now(),))
+            return cursor.fetchall()
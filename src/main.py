@@ -1,14 +1,26 @@
 """Main application module."""
 import asyncio
+import atexit
 import logging
+import queue
+import random
 import signal
 import sys
 import time
-import threading
 import warnings
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property, lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+# uvloop (optional, not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Suppress urllib3 OpenSSL warning on macOS
 warnings.filterwarnings('ignore', message='.*urllib3.*OpenSSL.*', category=UserWarning)
@@ -17,24 +29,42 @@ warnings.filterwarnings('ignore', message='.*urllib3.*OpenSSL.*', category=UserW
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import config
-from src.parser import BandcampParser, Release
 from src.database import Database
 from src.telegram_bot import TelegramBot
 from src.scheduler import TaskScheduler
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bandcamp_bot.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+if TYPE_CHECKING:
+    from src.parser import BandcampParser, Release
+
+# Configure logging: records are queued and written by a background listener,
+# so logging from the event loop never blocks on file or console I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('bandcamp_bot.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_queue_handler = QueueHandler(_log_queue)
+# Handlers on the listener side add the full line format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+# Flush queued records on exit
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _split_tags(tags: str) -> Tuple[str, ...]:
+    """Parse a stored comma-separated tags string (cached across retries)."""
+    return tuple(tag.strip() for tag in tags.split(",") if tag.strip())
+
+
 @dataclass
 class ParsingResult:
     """Result of a parsing run."""
@@ -46,16 +76,28 @@ class ParsingResult:
 class BandcampBot:
     """Main application class."""
     
+    # Failed sends back off exponentially with full jitter (seconds)
+    RETRY_BASE_DELAY = 60
+    RETRY_MAX_DELAY = 3600
+    # Longest the retry task sleeps between checks (seconds)
+    RETRY_INTERVAL = 20 * 60
+    # Seconds between scheduler health checks
+    HEALTH_CHECK_INTERVAL = 60
+    # Longest shutdown waits for a running parsing task (seconds)
+    SHUTDOWN_TIMEOUT = 60
+    # How long fetched tag results are reused (seconds)
+    TAG_CACHE_TTL = 10 * 60
+    
     def __init__(self):
         """Initialize application components."""
         # Database
         self.db = Database(db_path=config.database.db_path)
         
-        # Parser
-        self.parser = BandcampParser(
-            user_agent=config.parser.user_agent,
-            request_delay=config.parser.request_delay
-        )
+        # Tag fetches: tag -> (start time, fetch task)
+        self._tag_cache: Dict[str, Tuple[float, asyncio.Future]] = {}
+        
+        # URLs stored in the database, loaded once per parsing run
+        self._seen_urls: Optional[Set[str]] = None
         
         # Telegram bot
         self.telegram = TelegramBot(
@@ -71,48 +113,48 @@ class BandcampBot:
         )
         self.scheduler.set_task(self.run_parsing)
         
-        # Retry task control
-        self._retry_running = False
-        self._retry_thread: Optional[threading.Thread] = None
+        # Held while releases are stored unsent and being sent, so a retry
+        # pass never picks up (and resends) a batch that is still in flight
+        self._send_lock = asyncio.Lock()
+        
+        # Shutdown signal for tasks running on the main event loop
+        self._stop_event: Optional[asyncio.Event] = None
     
-    async def _process_release(
-        self, 
-        release: Release, 
-        send_to_telegram: bool = True
-    ) -> bool:
-        """Process a single release. Returns True if sent/added."""
-        # Check if exists
-        if self.db.exists(release.url):
-            return False
-        
-        # Add to database first (even if sending fails)
-        added = self.db.add(
-            release_url=release.url,
-            title=release.title,
-            artist=release.artist,
-            tags=release.tags,
-            cover_url=release.cover_url,
-            description=release.description
-        )
+    @cached_property
+    def parser(self) -> "BandcampParser":
+        """Parser shared by all fetches, with one warm browser per concurrent tag.
         
-        if not added:
-            return False
+        Created on first fetch, so startup doesn't import Selenium or launch Chrome.
+        """
+        from src.parser import BandcampParser
         
-        if send_to_telegram:
-            # Send to Telegram
-            success = await self.telegram.send_release(release)
-            if success:
-                self.db.mark_sent(release.url)
-                return True
-            else:
-                logger.warning(f"Failed to send: {release.title} (saved to DB for retry)")
-                return False
-        else:
-            # For blacklist, mark as sent immediately
-            self.db.mark_sent(release.url)
-            return True
+        return BandcampParser(
+            user_agent=config.parser.user_agent,
+            request_delay=config.parser.request_delay,
+            pool_size=max(1, config.parser.concurrency)
+        )
+    
+    def _get_releases(self, tag: str) -> asyncio.Future:
+        """Get fetch for tag, sharing a recent or in-flight one if present."""
+        now = time.monotonic()
+        cached = self._tag_cache.get(tag)
+        if cached and now - cached[0] < self.TAG_CACHE_TTL:
+            return cached[1]
+        
+        future = asyncio.ensure_future(self.parser.get_releases_by_tag_async(tag))
+        self._tag_cache[tag] = (now, future)
+        return future
+    
+    async def _fetch_tags(self, tags: List[str]) -> Dict[str, List["Release"]]:
+        """Fetch releases for all tags concurrently."""
+        # Launch the browsers off the event loop on first use
+        if "parser" not in self.__dict__:
+            await asyncio.to_thread(getattr, self, "parser")
+        
+        results = await asyncio.gather(*(self._get_releases(tag) for tag in tags))
+        return dict(zip(tags, results))
     
-    async def _process_blacklist(self) -> int:
+    async def _process_blacklist(self, fetched: Dict[str, List["Release"]]) -> int:
         """Process blacklist tags. Returns count of blacklisted."""
         blacklist_tags = config.blacklist_tags
         if not blacklist_tags:
@@ -125,67 +167,112 @@ class BandcampBot:
         
         for tag in blacklist_tags:
             logger.info(f"Blacklist tag: {tag}")
-            releases = self.parser.get_releases_by_tag(tag)
-            
-            for release in releases:
-                if await self._process_release(release, send_to_telegram=False):
-                    count += 1
-                    logger.debug(f"Blacklisted: {release.title}")
+            result = await self._ingest(fetched[tag], send_to_telegram=False)
+            count += result.blacklisted
         
         logger.info(f"Blacklisted {count} releases")
         return count
     
-    async def _process_main_tags(self) -> ParsingResult:
-        """Process main tags. Returns parsing result."""
+    def _next_retry_at(self, attempt: int) -> datetime:
+        """Get due time for the next retry after given number of failed retries."""
+        cap = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+        return datetime.now() + timedelta(seconds=random.uniform(0, cap))
+    
+    @staticmethod
+    def _release_row(release: "Release") -> tuple:
+        """Get release as a database row for add_many()/add_many_sent()."""
+        tags_str = ",".join(release.tags) if release.tags else None
+        return (release.url, release.title, release.artist, tags_str, release.cover_url)
+    
+    def _mark_delivered(self, release: "Release") -> None:
+        """Mark release sent as soon as it is delivered, so an interrupted batch can't resend it."""
+        self.db.mark_sent(release.url)
+    
+    async def _ingest(
+        self,
+        releases: List["Release"],
+        *,
+        send_to_telegram: bool
+    ) -> ParsingResult:
+        """Store releases not seen before and, unless blacklisting, send them.
+        
+        One existence lookup and one insert transaction, then concurrent
+        sends; each delivery is marked sent right away, failures in one
+        transaction at the end.
+        """
         result = ParsingResult()
         
-        logger.info("=" * 50)
-        logger.info("Processing main tags...")
-        
-        for tag in config.tags:
-            logger.info(f"Processing tag: {tag}")
-            releases = self.parser.get_releases_by_tag(tag)
-            tag_sent = 0
+        # Stored URLs: preloaded for the run, or looked up for just these releases
+        known = self._seen_urls
+        if known is None:
+            known = self.db.existing_urls(r.url for r in releases)
+        new_releases = list({
+            release.url: release for release in releases
+            if release.url not in known
+        }.values())
+        if not new_releases:
+            # Quiet tag: nothing to write or send
+            return result
+        
+        known.update(release.url for release in new_releases)
+        rows = [self._release_row(release) for release in new_releases]
+        
+        if not send_to_telegram:
+            # For blacklist, store the releases already marked as sent
+            result.blacklisted = self.db.add_many_sent(rows)
+            return result
+        
+        async with self._send_lock:
+            # Add to database first (even if sending fails)
+            self.db.add_many(rows)
             
-            for release in releases:
-                # Check if exists
-                if self.db.exists(release.url):
-                    continue
-                
-                # Add to database first (even if sending fails)
-                added = self.db.add(
-                    release_url=release.url,
-                    title=release.title,
-                    artist=release.artist,
-                    tags=release.tags,
-                    cover_url=release.cover_url
-                )
-                
-                if not added:
-                    continue
-                
-                # Send to Telegram
-                success = await self.telegram.send_release(release)
-                
+            # Send to Telegram concurrently (TelegramBot enforces rate limits)
+            results = await self.telegram.send_releases(
+                new_releases, on_sent=self._mark_delivered
+            )
+            
+            sent_count = 0
+            retries = []
+            for release, success in zip(new_releases, results):
                 if success:
-                    self.db.mark_sent(release.url)
-                    result.sent += 1
-                    tag_sent += 1
+                    sent_count += 1
                     logger.info(f"Sent: {release.title} by {release.artist}")
-                    await asyncio.sleep(2)  # Rate limiting
                 else:
-                    result.failed += 1
+                    retries.append((release.url, self._next_retry_at(0)))
                     logger.warning(f"Failed to send: {release.title} (saved to DB, sent_at=NULL)")
             
-            if tag_sent == 0:
+            self.db.schedule_retry_many(retries)
+        result.sent = sent_count
+        result.failed = len(retries)
+        return result
+    
+    async def _process_main_tags(self, fetched: Dict[str, List["Release"]]) -> ParsingResult:
+        """Process main tags. Returns parsing result."""
+        result = ParsingResult()
+        logger.info("=" * 50)
+        logger.info("Processing main tags...")
+        
+        for tag in config.tags:
+            logger.info(f"Processing tag: {tag}")
+            tag_result = await self._ingest(fetched[tag], send_to_telegram=True)
+            result.sent += tag_result.sent
+            result.failed += tag_result.failed
+            
+            if tag_result.sent == 0:
                 logger.info(f"No new releases for '{tag}'")
             else:
-                logger.info(f"Tag '{tag}': sent {tag_sent}")
+                logger.info(f"Tag '{tag}': sent {tag_result.sent}")
         
         return result
     
     async def _retry_failed_releases(self) -> None:
-        """Retry sending releases that failed to send (sent_at IS NULL)."""
+        """Retry sending releases that failed to send and are due again."""
+        # Wait out a batch being sent by run_parsing; its rows are unsent until it ends
+        async with self._send_lock:
+            await self._retry_due_releases()
+    
+    async def _retry_due_releases(self) -> None:
+        """Send due unsent releases and record the outcomes."""
         unsent_releases = self.db.get_unsent_releases()
         
         if not unsent_releases:
@@ -194,35 +281,41 @@ class BandcampBot:
         
         logger.info(f"Retrying {len(unsent_releases)} unsent release(s)...")
         
-        retried_count = 0
-        success_count = 0
+        from src.parser import Release
         
+        releases = []
         for record in unsent_releases:
             # Convert ReleaseRecord to Release object
-            tags_list = []
-            if record.tags:
-                tags_list = [tag.strip() for tag in record.tags.split(",") if tag.strip()]
-            
-            release = Release(
+            releases.append(Release(
                 url=record.release_url,
                 title=record.title,
                 artist=record.artist,
-                tags=tags_list,
+                tags=list(_split_tags(record.tags)) if record.tags else [],
                 cover_url=record.cover_url,
                 description=record.description
-            )
-            
-            # Try to send
-            success = await self.telegram.send_release(release)
-            retried_count += 1
-            
+            ))
+        
+        # Try to send concurrently (TelegramBot enforces rate limits)
+        results = await self.telegram.send_releases(releases, on_sent=self._mark_delivered)
+        
+        retried_count = len(releases)
+        success_count = 0
+        retries = []
+        
+        for record, release, success in zip(unsent_releases, releases, results):
             if success:
-                self.db.mark_sent(release.url)
                 success_count += 1
                 logger.info(f"Successfully sent (retry): {release.title} by {release.artist}")
-                await asyncio.sleep(2)  # Rate limiting
             else:
-                logger.warning(f"Retry failed: {release.title} (will retry again in 20 minutes)")
+                next_retry_at = self._next_retry_at(record.retry_count)
+                retries.append((release.url, next_retry_at))
+                logger.warning(
+                    f"Retry failed: {release.title} "
+                    f"(will retry again at {next_retry_at:%H:%M:%S})"
+                )
+        
+        # Record failures in one transaction
+        self.db.schedule_retry_many(retries)
         
         if success_count > 0:
             logger.info(f"Retry completed: {success_count}/{retried_count} releases sent successfully")
@@ -233,12 +326,21 @@ class BandcampBot:
         """Main parsing task."""
         logger.info("Starting parsing task...")
         
+        # Each scheduled run starts from fresh pages
+        self._tag_cache.clear()
+        
         try:
+            # Fetch every tag up front, concurrently
+            fetched = await self._fetch_tags([*config.blacklist_tags, *config.tags])
+            
+            # Check releases against stored URLs in memory for the rest of the run
+            self._seen_urls = self.db.get_all_urls()
+            
             # Process blacklist first
-            blacklisted = await self._process_blacklist()
+            blacklisted = await self._process_blacklist(fetched)
             
             # Process main tags
-            result = await self._process_main_tags()
+            result = await self._process_main_tags(fetched)
             result.blacklisted = blacklisted
             
             # Log summary
@@ -254,7 +356,9 @@ class BandcampBot:
             
             # Cleanup old records
             if config.database.cleanup_days > 0:
-                self.db.cleanup(config.database.cleanup_days)
+                deleted = self.db.cleanup(config.database.cleanup_days)
+                if deleted > Database.VACUUM_THRESHOLD:
+                    self.db.vacuum()
             
             logger.info("Parsing task completed")
             
@@ -267,6 +371,8 @@ class BandcampBot:
                 )
             except Exception:
                 pass
+        finally:
+            self._seen_urls = None
     
     async def _send_startup_message(self) -> None:
         """Send startup notification."""
@@ -286,135 +392,140 @@ class BandcampBot:
         )
         await self.telegram.send_message(message)
     
-    def _retry_loop(self) -> None:
-        """Background loop for retrying failed releases every 20 minutes."""
-        RETRY_INTERVAL = 20 * 60  # 20 minutes in seconds
-        
-        logger.info("Retry task started (runs every 20 minutes)")
-        
-        # Run immediately on startup, then every 20 minutes
-        first_run = True
+    def _seconds_until_next_retry(self) -> float:
+        """Get how long the retry task can sleep before a release is due."""
+        next_retry_at = self.db.next_retry_at()
+        if next_retry_at is None:
+            return self.RETRY_INTERVAL
+        wait = (next_retry_at - datetime.now()).total_seconds()
+        return min(self.RETRY_INTERVAL, max(1, wait))
+    
+    async def _retry_periodic(self) -> None:
+        """Retry failed releases as they become due, until shutdown."""
+        logger.info("Retry task started")
         
-        while self._retry_running:
+        # Run immediately on startup, then whenever the next release is due
+        while not self._stop_event.is_set():
             try:
-                # Run retry task
-                asyncio.run(self._retry_failed_releases())
+                await self._retry_failed_releases()
             except Exception as e:
                 logger.error(f"Error in retry task: {e}", exc_info=True)
             
-            # Wait 20 minutes before next retry (skip wait on first run)
-            if self._retry_running:
-                if first_run:
-                    first_run = False
-                    # Small delay after first run to avoid immediate retry
-                    time.sleep(5)
-                else:
-                    # Wait 20 minutes before next retry
-                    for _ in range(RETRY_INTERVAL):
-                        if not self._retry_running:
-                            break
-                        time.sleep(1)
+            # Sleep until the earliest scheduled retry (or shutdown)
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=self._seconds_until_next_retry()
+                )
+            except asyncio.TimeoutError:
+                pass
         
         logger.info("Retry task stopped")
     
-    def _start_retry_task(self) -> None:
-        """Start the background retry task."""
-        if self._retry_running:
-            return
-        
-        self._retry_running = True
-        self._retry_thread = threading.Thread(
-            target=self._retry_loop,
-            daemon=True,
-            name="RetryTask"
-        )
-        self._retry_thread.start()
-        logger.info("Started retry task for failed releases (every 20 minutes)")
-    
-    def _stop_retry_task(self) -> None:
-        """Stop the background retry task."""
-        if not self._retry_running:
-            return
-        
-        self._retry_running = False
-        if self._retry_thread:
-            self._retry_thread.join(timeout=5)
-        logger.info("Stopped retry task")
-    
     def _cleanup(self) -> None:
         """Cleanup resources."""
-        # Stop retry task
-        self._stop_retry_task()
-        
         # Suppress urllib3 warnings during shutdown
         logging.getLogger('urllib3').setLevel(logging.ERROR)
         
-        if self.parser.driver:
+        # The parser only exists if a fetch ever ran
+        parser = self.__dict__.get("parser")
+        if parser:
             try:
-                self.parser.driver.quit()
-                self.parser.driver = None
-                logger.info("Selenium driver closed")
+                parser.close()
+                logger.info("Selenium drivers and HTTP session closed")
             except Exception:
                 pass
         
-        if self.parser.session:
+        self.db.close()
+    
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Make SIGINT/SIGTERM request a graceful shutdown of the event loop."""
+        for sig in (signal.SIGINT, signal.SIGTERM):
             try:
-                self.parser.session.close()
-                logger.info("HTTP session closed")
-            except Exception:
-                pass
+                loop.add_signal_handler(sig, self._stop_event.set)
+            except NotImplementedError:
+                # Windows event loops don't support signal handlers
+                try:
+                    signal.signal(
+                        sig,
+                        lambda signum, frame: loop.call_soon_threadsafe(self._stop_event.set)
+                    )
+                except (AttributeError, ValueError):
+                    pass
     
-    def run(self) -> None:
-        """Run the application."""
-        logger.info("Starting Bandcamp Parser Bot...")
-        logger.info(f"Tags: {', '.join(config.tags)}")
-        if config.blacklist_tags:
-            logger.info(f"Blacklist: {', '.join(config.blacklist_tags)}")
-        logger.info(f"Schedule: {', '.join(config.schedule.times)} ({config.schedule.timezone})")
+    async def _async_main(self) -> None:
+        """Run scheduler jobs, retries and health checks on one event loop."""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._install_signal_handlers(loop)
         
-        # Start scheduler
-        self.scheduler.start()
+        # Open the Telegram connection pool shared by all sends
+        try:
+            await self.telegram.initialize()
+        except Exception as e:
+            logger.warning(f"Could not initialize Telegram bot: {e}")
+        
+        # Start scheduler; its jobs are run on this loop
+        self.scheduler.start(loop=loop)
         
         # Start retry task for failed releases
-        self._start_retry_task()
+        retry_task = asyncio.create_task(self._retry_periodic())
         
         # Send startup message
         try:
-            asyncio.run(self._send_startup_message())
+            await self._send_startup_message()
         except Exception as e:
             logger.warning(f"Could not send startup message: {e}")
         
-        # Signal handlers
-        def handle_signal(sig, frame):
-            logger.info("Shutting down...")
-            self.scheduler.stop()
-            self._cleanup()
-            logger.info("Application stopped")
-            sys.exit(0)
-        
-        try:
-            signal.signal(signal.SIGINT, handle_signal)
-            signal.signal(signal.SIGTERM, handle_signal)
-        except (AttributeError, ValueError):
-            pass  # Windows
-        
         # Main loop
         logger.info("Application running. Press Ctrl+C to stop.")
         
+        while not self._stop_event.is_set():
+            # Sleep until shutdown, waking periodically for a health check
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=self.HEALTH_CHECK_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                if not self.scheduler.is_running:
+                    logger.error("Scheduler stopped unexpectedly!")
+        
+        logger.info("Shutting down...")
+        self.scheduler.stop()
+        await retry_task
+        
+        # Let an in-flight parsing run finish its sends and database writes
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        if pending:
+            logger.info(f"Waiting for {len(pending)} running task(s)...")
+            await asyncio.wait(pending, timeout=self.SHUTDOWN_TIMEOUT)
+        
+        await self.telegram.close()
+        
+        # The parser's async HTTP client is bound to this loop
+        parser = self.__dict__.get("parser")
+        if parser:
+            await parser.aclose()
+    
+    def run(self) -> None:
+        """Run the application."""
+        logger.info("Starting Bandcamp Parser Bot...")
+        logger.info(f"Tags: {', '.join(config.tags)}")
+        if config.blacklist_tags:
+            logger.info(f"Blacklist: {', '.join(config.blacklist_tags)}")
+        logger.info(f"Schedule: {', '.join(config.schedule.times)} ({config.schedule.timezone})")
+        
+        if UVLOOP_AVAILABLE:
+            # libuv-based loop: cheaper socket dispatch for concurrent sends
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
+        
         try:
-            last_check = 0
-            while True:
-                time.sleep(1)
-                now = time.time()
-                
-                # Health check every 60 seconds
-                if now - last_check >= 60:
-                    last_check = now
-                    if not self.scheduler.is_running:
-                        logger.error("Scheduler stopped unexpectedly!")
-                        
+            asyncio.run(self._async_main())
         except KeyboardInterrupt:
             logger.info("Shutting down...")
+        finally:
             self.scheduler.stop()
             self._cleanup()
             logger.info("Application stopped")
@@ -1,18 +1,94 @@
 """Bandcamp parser module."""
+import asyncio
+import importlib.util
+import json
 import logging
 import platform
+import queue
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Generator
+from html import unescape
+from typing import Any, Callable, Dict, Iterator, List, Optional, Generator, Tuple
 from urllib.parse import urljoin
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Faster JSON decoding for the page data blob (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Precompiled patterns used for every link on a discover page
+_BY_SPLIT_RE = re.compile(r'\s+by\s+', re.IGNORECASE)
+_BANDCAMP_HOST_RE = re.compile(r'https?://([^.]+)\.bandcamp\.com')
+
+# Precompiled XPath queries, evaluated in C by lxml
+_LINKS_XPATH = etree.XPath(".//a[contains(@href, '/album/') or contains(@href, '/track/')]")
+_UPPER, _LOWER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"
+
+
+def _first_text_element_xpath(*class_parts: str) -> etree.XPath:
+    """Compile XPath for the first div/span with text whose class contains any of the parts (case-insensitive)."""
+    cls = f"translate(@class, '{_UPPER}', '{_LOWER}')"
+    cond = " or ".join(f"contains({cls}, '{part}')" for part in class_parts)
+    # Skip matches without text (e.g. a title span holding only an image)
+    return etree.XPath(f"(.//div[{cond}][normalize-space()] | .//span[{cond}][normalize-space()])[1]")
+
+
+_TITLE_ELEMENT_XPATH = _first_text_element_xpath('title', 'name')
+_ARTIST_ELEMENT_XPATH = _first_text_element_xpath('artist', 'by')
+_IMG_XPATH = etree.XPath("(.//img)[1]")
+
+# Release metadata Bandcamp embeds in the page, and the keys its items use
+_DATA_BLOB_RE = re.compile(r'data-blob="([^"]+)"')
+_BLOB_URL_KEYS = ('item_url', 'tralbum_url', 'url')
+_BLOB_ARTIST_KEYS = ('band_name', 'artist', 'artist_name')
+_BLOB_ART_KEYS = ('item_image_id', 'art_id', 'image_id')
+
+# Tag name to hashtag: spaces and dashes become underscores
+_TAG_TRANS = str.maketrans({' ': '_', '-': '_'})
+
+
+def _element_text(element) -> str:
+    """Get element text with each text node stripped (like bs4's get_text(strip=True))."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _first_value(item: Dict[str, Any], keys) -> Any:
+    """Get first truthy value of given keys."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
+def _iter_blob_items(node) -> Iterator[Dict[str, Any]]:
+    """Yield release-like dicts (title and album/track URL) from decoded data blob."""
+    if isinstance(node, dict):
+        url = _first_value(node, _BLOB_URL_KEYS)
+        if (isinstance(node.get('title'), str) and isinstance(url, str)
+                and ('/album/' in url or '/track/' in url)):
+            yield node
+            return
+        node = node.values()
+    elif not isinstance(node, list):
+        return
+    for child in node:
+        yield from _iter_blob_items(child)
+
 # Selenium imports (optional)
 try:
     from selenium import webdriver
@@ -21,10 +97,18 @@ try:
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.common.exceptions import TimeoutException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Async HTTP client for browserless fetches (optional)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 
 @dataclass
 class Release:
@@ -37,6 +121,10 @@ class Release:
     description: Optional[str] = None
     release_date: Optional[datetime] = None
     location: Optional[str] = None
+    hashtags: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.hashtags = " ".join(f"#{tag.translate(_TAG_TRANS)}" for tag in self.tags if tag)
     
     def __repr__(self) -> str:
         return f"<Release: {self.title} by {self.artist}>"
@@ -55,11 +143,14 @@ BandcampRelease = Release
 class SeleniumHelper:
     """Helper class for Selenium operations."""
     
-    # Timeouts
+    # Timeouts: explicit waits on page conditions instead of fixed delays
     PAGE_LOAD_TIMEOUT = 10
-    IMPLICIT_WAIT = 5
+    IMPLICIT_WAIT = 0  # implicit waits would stall every empty find_elements()
     ELEMENT_WAIT = 3
-    ACTION_DELAY = 5
+    SCROLL_WAIT = 2
+    
+    # Release links on a discover page
+    RELEASE_LINKS_CSS = "a[href*='/album/'], a[href*='/track/']"
     
     # XPath selectors
     COOKIE_SELECTORS = [
@@ -110,74 +201,94 @@ class SeleniumHelper:
                 "arguments[0].scrollIntoView({block: 'center'});", 
                 element
             )
-            time.sleep(0.5)
         except Exception:
             pass
     
+    def _page_height(self) -> int:
+        return self.driver.execute_script("return document.body.scrollHeight")
+    
     def scroll_to_bottom(self) -> None:
-        """Scroll to bottom of page."""
+        """Scroll to bottom of page until it stops growing."""
         try:
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
+            last_height = self._page_height()
             for _ in range(5):
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
+                try:
+                    WebDriverWait(self.driver, self.SCROLL_WAIT).until(
+                        lambda driver: self._page_height() != last_height
+                    )
+                except TimeoutException:
                     break
-                last_height = new_height
+                last_height = self._page_height()
         except Exception as e:
             logger.debug(f"Scroll error: {e}")
     
+    def count_release_links(self) -> int:
+        """Count release links currently on the page."""
+        return len(self.driver.find_elements(By.CSS_SELECTOR, self.RELEASE_LINKS_CSS))
+    
+    def wait_for_release_links(self, more_than: int = 0, timeout: float = PAGE_LOAD_TIMEOUT) -> bool:
+        """Wait until the page shows more than given number of release links."""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: self.count_release_links() > more_than
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def find_and_click(self, selectors: List[str], description: str) -> bool:
         """Find element by selectors and click it."""
-        for selector in selectors:
-            try:
-                wait = WebDriverWait(self.driver, self.ELEMENT_WAIT)
-                element = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                self.scroll_into_view(element)
-                if self.click_element(element):
-                    logger.info(f"Clicked {description}")
-                    return True
-            except Exception:
-                continue
+        try:
+            element = WebDriverWait(self.driver, self.ELEMENT_WAIT).until(
+                EC.any_of(*(
+                    EC.element_to_be_clickable((By.XPATH, selector))
+                    for selector in selectors
+                ))
+            )
+        except TimeoutException:
+            return False
+        
+        self.scroll_into_view(element)
+        if self.click_element(element):
+            logger.info(f"Clicked {description}")
+            return True
         return False
     
     def accept_cookies(self) -> bool:
         """Accept cookie consent if present."""
-        result = self.find_and_click(self.COOKIE_SELECTORS, "cookie consent")
-        if result:
-            time.sleep(self.ACTION_DELAY)
-        return result
+        return self.find_and_click(self.COOKIE_SELECTORS, "cookie consent")
+    
+    def _find_view_more(self):
+        """Wait for a visible 'View more' button. Returns None if there is none."""
+        def visible_button(driver):
+            for selector in self.VIEW_MORE_SELECTORS:
+                for elem in driver.find_elements(By.XPATH, selector):
+                    try:
+                        if elem.is_displayed() and elem.is_enabled() and 'more' in elem.text.lower():
+                            return elem
+                    except Exception:
+                        continue
+            return False
+        
+        try:
+            return WebDriverWait(self.driver, self.ELEMENT_WAIT).until(visible_button)
+        except TimeoutException:
+            return None
     
     def click_view_more(self, max_clicks: int = 5) -> int:
         """Click 'View more results' button repeatedly."""
         clicks = 0
         
-        for i in range(max_clicks):
-            if i > 0:
-                time.sleep(self.ACTION_DELAY)
-            
+        for _ in range(max_clicks):
             self.scroll_to_bottom()
-            time.sleep(3)
             
+            button = self._find_view_more()
+            links_before = self.count_release_links() if button else 0
             clicked = False
-            for selector in self.VIEW_MORE_SELECTORS:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            text = elem.text.lower()
-                            if 'more' in text:
-                                self.scroll_into_view(elem)
-                                if self.click_element(elem):
-                                    clicks += 1
-                                    clicked = True
-                                    logger.info(f"Clicked 'View more' ({clicks}/{max_clicks})")
-                                    break
-                except Exception:
-                    continue
-                if clicked:
-                    break
+            if button:
+                self.scroll_into_view(button)
+                clicked = self.click_element(button)
             
             if not clicked:
                 if clicks == 0:
@@ -185,24 +296,170 @@ class SeleniumHelper:
                 else:
                     logger.info(f"'View more' button disappeared after {clicks} clicks")
                 break
+            
+            clicks += 1
+            logger.info(f"Clicked 'View more' ({clicks}/{max_clicks})")
+            
+            # Continue as soon as the next batch of releases has rendered
+            self.wait_for_release_links(more_than=links_before)
         
         return clicks
 
 
+class BrowserPool:
+    """Pool of warm Selenium drivers shared by concurrent tag fetches."""
+    
+    # Longest acquire() waits for a free driver (seconds)
+    ACQUIRE_TIMEOUT = 300
+    # Seconds between liveness checks of idle drivers
+    HEALTH_CHECK_INTERVAL = 60
+    
+    def __init__(self, factory: Callable[[], Optional["webdriver.Chrome"]], size: int = 1):
+        """Start up to `size` drivers created by `factory` (which returns None on failure)."""
+        self._factory = factory
+        self._idle: queue.Queue = queue.Queue()
+        self._drivers: List = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        
+        for _ in range(max(1, size)):
+            driver = factory()
+            if driver is None:
+                break
+            self._drivers.append(driver)
+            self._idle.put(driver)
+        
+        self._health_thread = threading.Thread(
+            target=self._health_check_loop,
+            name="browser-pool-health",
+            daemon=True
+        )
+        if self._drivers:
+            self._health_thread.start()
+    
+    @property
+    def size(self) -> int:
+        """Get number of live drivers."""
+        with self._lock:
+            return len(self._drivers)
+    
+    def acquire(self, timeout: Optional[float] = None):
+        """Take a free driver, or None if none is left or frees up in time (ACQUIRE_TIMEOUT)."""
+        if self._closed.is_set() or self.size == 0:
+            return None
+        try:
+            driver = self._idle.get(timeout=self.ACQUIRE_TIMEOUT if timeout is None else timeout)
+        except queue.Empty:
+            return None
+        if driver is None:
+            # Wake-up from replace() after the last driver died; pass it on to other waiters
+            self._idle.put(None)
+        return driver
+    
+    def release(self, driver) -> None:
+        """Return a driver taken with acquire()."""
+        if self._closed.is_set():
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+    
+    def replace(self, driver):
+        """Quit a broken driver and start a fresh one in its place.
+        
+        Returns the new driver (owned by the caller, like acquire()), or None
+        if it could not be started; the pool then shrinks by one.
+        """
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self._quit(driver)
+        
+        new_driver = self._factory()
+        with self._lock:
+            if new_driver is not None:
+                self._drivers.append(new_driver)
+            empty = not self._drivers
+        if empty:
+            # No driver will ever be released again: wake up blocked acquire() calls
+            self._idle.put(None)
+        return new_driver
+    
+    def _health_check_loop(self) -> None:
+        """Periodically ping idle drivers and relaunch dead ones."""
+        while not self._closed.wait(self.HEALTH_CHECK_INTERVAL):
+            for _ in range(self._idle.qsize()):
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if driver is None:
+                    # Pool is empty, keep the wake-up for acquire()
+                    self._idle.put(None)
+                    break
+                try:
+                    driver.title
+                except Exception:
+                    logger.warning("Selenium driver stopped responding, restarting it")
+                    driver = self.replace(driver)
+                if driver is not None:
+                    self.release(driver)
+    
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Quit every driver; drivers still in use are quit when released."""
+        self._closed.set()
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                if driver in self._drivers:
+                    self._drivers.remove(driver)
+            self._quit(driver)
+
+
 class BandcampParser:
     """Parser for Bandcamp releases."""
     
     BASE_URL = "https://bandcamp.com"
     DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     
+    # HTTP fallback: kept-alive connections and retries with exponential backoff
+    HTTP_POOL_SIZE = 16
+    HTTP_RETRIES = 2
+    HTTP_TIMEOUT = 10
+    
+    # Cover image URL for an art id from the page data blob
+    COVER_URL_TEMPLATE = "https://f4.bcbits.com/img/a{}_10.jpg"
+    
+    # Resources the browser never needs to download (only the DOM is scraped)
+    BLOCKED_URLS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+        "*.woff", "*.woff2", "*.ttf",
+        "*.mp3", "*.mp4",
+        "*google-analytics*", "*googletagmanager*", "*facebook*",
+    ]
+    
     def __init__(
         self,
         base_url: str = BASE_URL,
         user_agent: Optional[str] = None,
         request_delay: float = 1.5,
-        use_selenium: bool = True
+        use_selenium: bool = True,
+        pool_size: int = 1
     ):
-        """Initialize parser."""
+        """Initialize parser.
+        
+        Args:
+            pool_size: Number of browsers kept warm, i.e. tags fetched at once
+        """
         self.base_url = base_url.rstrip('/')
         self.request_delay = request_delay
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
@@ -216,18 +473,50 @@ class BandcampParser:
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         })
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_SIZE,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=self.HTTP_RETRIES,
+                backoff_factor=1,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Last good response per URL for conditional GETs: (ETag, Last-Modified, HTML)
+        self._http_cache: Dict[str, Tuple[Optional[str], Optional[str], str]] = {}
         
-        # Selenium driver
-        self.driver = None
-        self._helper: Optional[SeleniumHelper] = None
+        # Selenium drivers, started once and reused across tags
+        self._pool: Optional[BrowserPool] = None
         
         if self.use_selenium:
-            self._init_driver()
+            self._pool = BrowserPool(self._create_driver, pool_size)
+            if self._pool.size:
+                logger.info(f"Selenium WebDriver pool initialized ({self._pool.size} browser(s))")
+            else:
+                logger.warning("Falling back to requests")
+                self.use_selenium = False
+                self._pool = None
         elif use_selenium and not SELENIUM_AVAILABLE:
             logger.warning("Selenium not available. Install: pip install selenium")
+        
+        # Async HTTP client, created on first use in the running event loop
+        self._http: Optional["httpx.AsyncClient"] = None
+        
+        # Concurrent async fetches: one per browser, or pool_size HTTPX requests
+        self._fetch_slots = asyncio.Semaphore(
+            self.pool_size if self.use_selenium or not HTTPX_AVAILABLE else max(1, pool_size)
+        )
     
-    def _init_driver(self) -> None:
-        """Initialize Selenium WebDriver."""
+    @property
+    def pool_size(self) -> int:
+        """Get number of tags that can be fetched at once."""
+        return self._pool.size if self._pool else 1
+    
+    def _create_driver(self) -> Optional["webdriver.Chrome"]:
+        """Start a Selenium WebDriver. Returns None on failure."""
         try:
             options = Options()
             options.add_argument('--headless')
@@ -237,71 +526,132 @@ class BandcampParser:
             options.add_argument('--disable-images')
             options.add_argument('--blink-settings=imagesEnabled=false')
             options.add_argument(f'user-agent={self.session.headers["User-Agent"]}')
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
             
             # Linux-specific options
             if platform.system() != 'Windows':
                 options.add_argument('--no-sandbox')
                 options.add_argument('--disable-dev-shm-usage')
             
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.set_page_load_timeout(SeleniumHelper.PAGE_LOAD_TIMEOUT)
-            self.driver.implicitly_wait(SeleniumHelper.IMPLICIT_WAIT)
-            self._helper = SeleniumHelper(self.driver)
+            driver = webdriver.Chrome(options=options)
+            driver.set_page_load_timeout(SeleniumHelper.PAGE_LOAD_TIMEOUT)
+            driver.implicitly_wait(SeleniumHelper.IMPLICIT_WAIT)
+            
+            # Drop media, fonts and trackers at the network layer
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URLS})
+            except Exception as e:
+                logger.debug(f"Could not set blocked URLs: {e}")
             
-            logger.info("Selenium WebDriver initialized")
+            return driver
             
         except Exception as e:
             logger.error(f"Failed to initialize Selenium: {e}")
-            logger.warning("Falling back to requests")
-            self.use_selenium = False
-            self.driver = None
+            return None
     
-    def _restart_driver(self) -> bool:
-        """Restart Selenium driver."""
-        if not self.use_selenium:
-            return False
-        
-        try:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except Exception:
-                    pass
-                self.driver = None
-            
-            self._init_driver()
-            return self.driver is not None
-            
-        except Exception as e:
-            logger.error(f"Failed to restart driver: {e}")
-            return False
+    def close(self) -> None:
+        """Quit the browsers and close the HTTP session."""
+        # Suppress urllib3 warnings during shutdown
+        logging.getLogger('urllib3').setLevel(logging.ERROR)
+        if self._pool:
+            self._pool.close()
+            self._pool = None
+        self.session.close()
+        # An async client still open here can't be awaited; its loop is gone
+        self._http = None
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client (on the event loop that used it)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     def __del__(self):
         """Cleanup."""
-        # Suppress urllib3 warnings during shutdown
-        logging.getLogger('urllib3').setLevel(logging.ERROR)
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.driver = None
-            except Exception:
-                pass
-    
-    def _fetch_with_requests(self, url: str, retries: int = 2) -> Optional[str]:
-        """Fetch page using requests library."""
-        for attempt in range(retries):
-            try:
-                time.sleep(self.request_delay)
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return response.text
-            except requests.Timeout:
-                logger.warning(f"Timeout fetching {url} (attempt {attempt + 1})")
-                time.sleep(3 * (attempt + 1))
-            except requests.RequestException as e:
-                logger.error(f"Request error: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 * (attempt + 1))
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _fetch_with_requests(self, url: str) -> Optional[str]:
+        """Fetch page using requests library (the session's adapter retries failures)."""
+        try:
+            time.sleep(self.request_delay)
+            response = self.session.get(
+                url, headers=self._conditional_headers(url), timeout=self.HTTP_TIMEOUT
+            )
+            if response.status_code == 304 and url in self._http_cache:
+                logger.debug(f"Not modified: {url}")
+                return self._http_cache[url][2]
+            response.raise_for_status()
+            self._cache_response(url, response.headers, response.text)
+            return response.text
+        except requests.Timeout:
+            logger.warning(f"Timeout fetching {url}")
+        except requests.RequestException as e:
+            logger.error(f"Request error: {e}")
+        return None
+    
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Get If-None-Match/If-Modified-Since headers for cached URL."""
+        headers = {}
+        cached = self._http_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+    
+    def _cache_response(self, url: str, headers, text: str) -> None:
+        """Remember response body if it carries validators."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            self._http_cache[url] = (etag, last_modified, text)
+    
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Get the shared async HTTP client, creating it on first use."""
+        if self._http is None:
+            limits = httpx.Limits(
+                max_connections=self.HTTP_POOL_SIZE,
+                max_keepalive_connections=self.HTTP_POOL_SIZE
+            )
+            transport = httpx.AsyncHTTPTransport(
+                # HTTP/2 multiplexing needs the h2 package
+                http2=importlib.util.find_spec('h2') is not None,
+                limits=limits,
+                retries=self.HTTP_RETRIES
+            )
+            self._http = httpx.AsyncClient(
+                transport=transport,
+                headers=dict(self.session.headers),
+                timeout=self.HTTP_TIMEOUT,
+                follow_redirects=True
+            )
+        return self._http
+    
+    async def _afetch(self, url: str) -> Optional[str]:
+        """Fetch page with the shared async HTTP client."""
+        try:
+            await asyncio.sleep(self.request_delay)
+            response = await self._get_http_client().get(
+                url, headers=self._conditional_headers(url)
+            )
+            if response.status_code == 304 and url in self._http_cache:
+                logger.debug(f"Not modified: {url}")
+                return self._http_cache[url][2]
+            response.raise_for_status()
+            self._cache_response(url, response.headers, response.text)
+            return response.text
+        except httpx.TimeoutException:
+            logger.warning(f"Timeout fetching {url}")
+        except httpx.HTTPError as e:
+            logger.error(f"Request error: {e}")
         return None
     
     def _fetch_with_selenium(
@@ -310,86 +660,104 @@ class BandcampParser:
         click_view_more: bool = False,
         retries: int = 2
     ) -> Optional[str]:
-        """Fetch page using Selenium."""
-        if not self.driver or not self._helper:
+        """Fetch page using a pooled Selenium driver."""
+        if not self._pool:
             return None
         
-        for attempt in range(retries):
-            try:
-                self.driver.get(url)
-                time.sleep(SeleniumHelper.ACTION_DELAY)
-                
-                # Handle cookie consent
-                self._helper.accept_cookies()
-                time.sleep(SeleniumHelper.ACTION_DELAY)
-                
-                # Click view more if requested
-                if click_view_more:
-                    logger.info("Clicking 'View more results'...")
-                    clicks = self._helper.click_view_more()
-                    if clicks > 0:
-                        logger.info(f"✓ Clicked 'View more' {clicks} time(s)")
-                
-                return self.driver.page_source
-                
-            except Exception as e:
-                logger.warning(f"Selenium error (attempt {attempt + 1}): {e}")
-                if attempt < retries - 1:
-                    self._restart_driver()
-                    time.sleep(3 * (attempt + 1))
+        driver = self._pool.acquire()
+        if driver is None:
+            logger.error("No Selenium driver available")
+            return None
         
-        return None
+        try:
+            for attempt in range(retries):
+                try:
+                    # Fresh state for every tag without relaunching the browser
+                    driver.delete_all_cookies()
+                    helper = SeleniumHelper(driver)
+                    
+                    driver.get(url)
+                    helper.wait_for_release_links()
+                    
+                    # Handle cookie consent
+                    helper.accept_cookies()
+                    
+                    # Click view more if requested
+                    if click_view_more:
+                        logger.info("Clicking 'View more results'...")
+                        clicks = helper.click_view_more()
+                        if clicks > 0:
+                            logger.info(f"✓ Clicked 'View more' {clicks} time(s)")
+                    
+                    return driver.page_source
+                    
+                except Exception as e:
+                    logger.warning(f"Selenium error (attempt {attempt + 1}): {e}")
+                    if attempt < retries - 1:
+                        # Only a failing browser gets relaunched
+                        driver = self._pool.replace(driver)
+                        if driver is None:
+                            return None
+                        time.sleep(3 * (attempt + 1))
+            
+            return None
+        finally:
+            if driver is not None:
+                self._pool.release(driver)
     
     def _fetch_page(self, url: str, click_view_more: bool = False) -> Optional[str]:
         """Fetch page HTML."""
-        if self.use_selenium and self.driver:
+        if self.use_selenium and self._pool:
             html = self._fetch_with_selenium(url, click_view_more)
             if html:
                 return html
-            logger.warning("Selenium failed, falling back to requests")
+            if self._pool.size == 0:
+                # Every browser died and none could be relaunched
+                logger.warning("No Selenium drivers left, switching to requests")
+                self.use_selenium = False
+            else:
+                logger.warning("Selenium failed, falling back to requests")
         
         return self._fetch_with_requests(url)
     
-    def _parse_release_link(self, link, tag: str) -> Optional[Release]:
-        """Parse release from link element."""
-        href = link.get('href', '')
+    def _parse_release_link(self, link, tag: str, href: str) -> Optional[Release]:
+        """Parse release from link element, given its href without query string."""
         if not href:
             return None
         
-        # Clean and normalize URL
-        href = href.split('?')[0]
+        # Normalize URL
         if not href.startswith('http'):
             release_url = urljoin(self.base_url, href)
         else:
             release_url = href
         
         # Extract title and artist
-        text = link.get_text(strip=True)
+        text = _element_text(link)
         title, artist = None, None
         
         if 'by' in text.lower():
-            parts = re.split(r'\s+by\s+', text, flags=re.IGNORECASE)
+            parts = _BY_SPLIT_RE.split(text)
             if len(parts) >= 2:
                 title = parts[0].strip()
                 artist = parts[-1].strip()
         
         # Try parent elements
         if not title or not artist:
-            parent = link.parent
-            if parent:
-                for elem in parent.find_all(['div', 'span']):
-                    cls = str(elem.get('class', [])).lower()
-                    if 'title' in cls or 'name' in cls:
-                        title = title or elem.get_text(strip=True)
-                    if 'artist' in cls or 'by' in cls:
-                        artist = artist or elem.get_text(strip=True)
+            parent = link.getparent()
+            if parent is not None:
+                if not title:
+                    found = _TITLE_ELEMENT_XPATH(parent)
+                    title = _element_text(found[0]) if found else None
+                if not artist:
+                    found = _ARTIST_ELEMENT_XPATH(parent)
+                    artist = _element_text(found[0]) if found else None
         
         # Fallback
         if not title:
-            title = text.split('by')[0].strip() if 'by' in text else text
+            title = text.partition('by')[0].strip()
         
         if not artist:
-            match = re.search(r'https?://([^.]+)\.bandcamp\.com', release_url)
+            match = _BANDCAMP_HOST_RE.search(release_url)
             if match:
                 artist = match.group(1).replace('-', ' ').title()
             else:
@@ -400,10 +768,11 @@ class BandcampParser:
         
         # Extract cover image
         cover_url = None
-        img = link.find('img')
-        if not img and link.parent:
-            img = link.parent.find('img')
-        if img:
+        images = _IMG_XPATH(link)
+        if not images and link.getparent() is not None:
+            images = _IMG_XPATH(link.getparent())
+        if images:
+            img = images[0]
             cover_url = img.get('src') or img.get('data-src')
             if cover_url and not cover_url.startswith('http'):
                 cover_url = urljoin(self.base_url, cover_url)
@@ -416,61 +785,150 @@ class BandcampParser:
             cover_url=cover_url
         )
     
-    def get_releases_by_tag(self, tag: str) -> List[Release]:
-        """Get releases by tag from Bandcamp."""
-        releases = []
-        tag_url = tag.replace(' ', '-')
+    def _parse_data_blob(self, html: str, tag: str) -> Optional[List[Release]]:
+        """Parse releases from page data blob; None if page has no usable blob."""
+        match = _DATA_BLOB_RE.search(html)
+        if not match:
+            return None
         
-        # Restart driver for fresh state
-        if self.use_selenium:
-            self._restart_driver()
-            if not self.driver:
-                logger.error(f"Driver not available for tag '{tag}'")
-                return releases
+        try:
+            data = _json_loads(unescape(match.group(1)))
+        except ValueError as e:
+            logger.debug(f"Could not decode data blob for tag '{tag}': {e}")
+            return None
         
-        url = f"{self.base_url}/discover/{tag_url}?s=new"
+        releases = {}
+        for item in _iter_blob_items(data):
+            release_url = urljoin(self.base_url, _first_value(item, _BLOB_URL_KEYS).partition('?')[0])
+            if release_url in releases or not item['title'].strip():
+                continue
+            
+            artist = _first_value(item, _BLOB_ARTIST_KEYS)
+            if not isinstance(artist, str):
+                match = _BANDCAMP_HOST_RE.search(release_url)
+                artist = match.group(1).replace('-', ' ').title() if match else "Unknown Artist"
+            
+            art_id = _first_value(item, _BLOB_ART_KEYS)
+            releases[release_url] = Release(
+                url=release_url,
+                title=item['title'].strip(),
+                artist=artist.strip(),
+                tags=[tag],
+                cover_url=self.COVER_URL_TEMPLATE.format(art_id) if isinstance(art_id, int) else None
+            )
         
+        return list(releases.values()) or None
+    
+    def _tag_url(self, tag: str) -> str:
+        """Get discover page URL for tag, newest first."""
+        tag_url = tag.replace(' ', '-')
+        return f"{self.base_url}/discover/{tag_url}?s=new"
+    
+    def iter_releases_by_tag(self, tag: str) -> Generator[Release, None, None]:
+        """Yield releases by tag from Bandcamp as each one is parsed."""
         logger.info(f"Fetching releases for tag '{tag}'")
         
-        html = self._fetch_page(url, click_view_more=True)
-        if not html:
-            return releases
+        html = self._fetch_page(self._tag_url(tag), click_view_more=True)
+        if html:
+            yield from self._iter_releases_from_html(html, tag)
+    
+    def _iter_releases_from_html(self, html: str, tag: str) -> Generator[Release, None, None]:
+        """Yield releases parsed from a discover page."""
+        # Without a browser the page is as served, so its data blob lists
+        # every release; after "view more" clicks only the DOM is complete
+        if not self.use_selenium:
+            releases = self._parse_data_blob(html, tag)
+            if releases:
+                logger.info(f"Found {len(releases)} releases for tag '{tag}'")
+                yield from releases
+                return
         
-        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            tree = lxml.html.fromstring(html)
+        except etree.ParserError as e:
+            logger.error(f"Could not parse page for tag '{tag}': {e}")
+            return
         
         # Find release links
-        links = soup.find_all('a', href=re.compile(r'/album/|/track/'))
+        links = _LINKS_XPATH(tree)
         
-        # Deduplicate
-        seen = set()
-        unique_links = []
+        # Deduplicate by href without query string, keeping the first link
+        unique_links = {}
         for link in links:
-            href = link.get('href', '').split('?')[0]
-            if href and href not in seen:
-                seen.add(href)
-                unique_links.append(link)
+            href = link.get('href', '').partition('?')[0]
+            if href:
+                unique_links.setdefault(href, link)
         
         if not unique_links:
             logger.warning(f"No releases found for tag '{tag}'")
-            return releases
+            return
         
-        for link in unique_links:
+        found = 0
+        for href, link in unique_links.items():
             try:
-                release = self._parse_release_link(link, tag)
-                if release:
-                    releases.append(release)
+                release = self._parse_release_link(link, tag, href)
             except Exception as e:
                 logger.error(f"Error parsing release: {e}")
+                continue
+            if release:
+                found += 1
+                yield release
         
-        logger.info(f"Found {len(releases)} releases for tag '{tag}'")
-        return releases
+        logger.info(f"Found {found} releases for tag '{tag}'")
+    
+    def get_releases_by_tag(self, tag: str) -> List[Release]:
+        """Get releases by tag from Bandcamp."""
+        return list(self.iter_releases_by_tag(tag))
+    
+    async def get_releases_by_tag_async(self, tag: str) -> List[Release]:
+        """Get releases by tag, at most pool_size tags at once.
+        
+        Without a browser the page is fetched on the event loop with the
+        shared HTTPX client; browsers are driven in a worker thread.
+        """
+        async with self._fetch_slots:
+            if self.use_selenium or not HTTPX_AVAILABLE:
+                if self.use_selenium:
+                    # Space out page loads across parallel fetches (requests mode sleeps per request)
+                    await asyncio.sleep(self.request_delay)
+                return await asyncio.to_thread(self.get_releases_by_tag, tag)
+            
+            logger.info(f"Fetching releases for tag '{tag}'")
+            html = await self._afetch(self._tag_url(tag))
+        
+        if not html:
+            return []
+        return await asyncio.to_thread(list, self._iter_releases_from_html(html, tag))
     
     def get_releases_generator(self, tags: List[str]) -> Generator[Release, None, None]:
-        """Generator yielding unique releases from all tags."""
+        """Generator yielding unique releases from all tags.
+        
+        With a single browser releases are yielded as they are parsed;
+        otherwise tags are fetched concurrently, one per browser, and
+        releases are yielded tag by tag as each fetch completes.
+        """
         seen_urls = set()
         
-        for tag in tags:
-            for release in self.get_releases_by_tag(tag):
-                if release.url not in seen_urls:
-                    seen_urls.add(release.url)
-                    yield release
+        if self.pool_size == 1:
+            # Single browser: stream each tag so consumers overlap with parsing
+            for tag in dict.fromkeys(tags):
+                for release in self.iter_releases_by_tag(tag):
+                    if release.url not in seen_urls:
+                        seen_urls.add(release.url)
+                        yield release
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=self.pool_size)
+        
+        try:
+            futures = [
+                executor.submit(self.get_releases_by_tag, tag)
+                for tag in dict.fromkeys(tags)
+            ]
+            for future in as_completed(futures):
+                for release in future.result():
+                    if release.url not in seen_urls:
+                        seen_urls.add(release.url)
+                        yield release
+        finally:
+            executor.shutdown(cancel_futures=True)
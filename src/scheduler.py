@@ -1,11 +1,9 @@
 """Scheduler module for running tasks at specified times."""
 import logging
 import asyncio
-import time
-import threading
 from datetime import datetime
 from typing import List, Callable, Awaitable, Optional
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 
@@ -32,12 +30,11 @@ class TaskScheduler:
         """
         self._times = times
         self._timezone = pytz.timezone(timezone)
-        self._scheduler = BlockingScheduler(timezone=self._timezone)
+        self._scheduler = AsyncIOScheduler(timezone=self._timezone)
         self._task_function: Optional[TaskFunction] = None
-        self._thread: Optional[threading.Thread] = None
     
     @property
-    def scheduler(self) -> BlockingScheduler:
+    def scheduler(self) -> AsyncIOScheduler:
         """Get underlying scheduler."""
         return self._scheduler
     
@@ -88,7 +85,7 @@ class TaskScheduler:
             
             logger.info(f"Scheduled task for {time_str} ({self._timezone})")
     
-    def _execute_task(self) -> None:
+    async def _execute_task(self) -> None:
         """Execute the task function."""
         current_time = datetime.now(self._timezone)
         
@@ -101,7 +98,7 @@ class TaskScheduler:
             return
         
         try:
-            asyncio.run(self._task_function())
+            await self._task_function()
             logger.info("=" * 60)
             logger.info(f"Task completed at {datetime.now(self._timezone)}")
             logger.info("=" * 60)
@@ -109,30 +106,21 @@ class TaskScheduler:
             logger.error(f"Error in task: {e}", exc_info=True)
             # Don't re-raise - scheduler should continue
     
-    def _run_scheduler_loop(self) -> None:
-        """Run scheduler in thread."""
-        try:
-            self._scheduler.start(paused=False)
-        except (KeyboardInterrupt, SystemExit):
-            logger.info("Scheduler interrupted")
-    
-    def start(self) -> None:
-        """Start the scheduler."""
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Start the scheduler; jobs then run as tasks on the event loop.
+        
+        Args:
+            loop: Event loop to run the task on; the current loop if omitted
+        """
         if not self._task_function:
             raise ValueError("Task function not set. Call set_task() first.")
         
+        if loop:
+            self._scheduler.configure(event_loop=loop)
         self._add_jobs()
         
-        # Start in background thread
         logger.info("Starting scheduler...")
-        self._thread = threading.Thread(
-            target=self._run_scheduler_loop,
-            daemon=False
-        )
-        self._thread.start()
-        
-        # Wait for scheduler to initialize
-        time.sleep(1)
+        self._scheduler.start(paused=False)
         
         # Log status
         self._log_status()
@@ -159,7 +147,11 @@ class TaskScheduler:
     def stop(self) -> None:
         """Stop the scheduler."""
         if self._scheduler.running:
-            self._scheduler.shutdown(wait=False)
+            try:
+                self._scheduler.shutdown(wait=False)
+            except RuntimeError:
+                # Event loop already closed; nothing left to schedule on it
+                return
             logger.info("Scheduler stopped")
     
     async def run_now(self) -> None:
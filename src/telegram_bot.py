@@ -1,13 +1,39 @@
 """Telegram bot module for sending releases."""
 import logging
 import asyncio
-from typing import Any, Protocol
+import random
+import time
+from collections import deque
+from functools import lru_cache
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
 from telegram import Bot
-from telegram.error import TelegramError, TimedOut, NetworkError
+from telegram.error import TelegramError, TimedOut, NetworkError, RetryAfter
 from telegram.request import HTTPXRequest
 
 logger = logging.getLogger(__name__)
 
+# Single-pass replacement table for Telegram's HTML parse mode
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+@lru_cache(maxsize=4096)
+def _format_message(url: str, title: str, artist: str, hashtags: str) -> str:
+    """Format release fields as Telegram message (cached, e.g. across retries)."""
+    lines = [
+        f"🎵 <b>{title.translate(_HTML_ESCAPE)}</b>",
+        f"👤 <b>{artist.translate(_HTML_ESCAPE)}</b>",
+        "",
+    ]
+    
+    if hashtags:
+        lines.append(f"🏷️ {hashtags}")
+        lines.append("")
+    
+    lines.append(f"🔗 <a href='{url}'>Open on Bandcamp</a>")
+    
+    return "\n".join(lines)
+
 
 class ReleaseProtocol(Protocol):
     """Protocol for release objects."""
@@ -15,6 +41,32 @@ class ReleaseProtocol(Protocol):
     title: str
     artist: str
     tags: list
+    hashtags: str
+
+
+class RateLimiter:
+    """Async sliding-window rate limiter over one or more (calls, period) limits."""
+    
+    def __init__(self, limits: Sequence[Tuple[int, float]]):
+        self._limits = limits
+        self._calls: deque = deque(maxlen=max(calls for calls, _ in limits))
+    
+    async def acquire(self) -> None:
+        """Wait until a call fits into every window, then record it."""
+        while True:
+            now = time.monotonic()
+            delay = max(
+                (
+                    period - (now - self._calls[-calls])
+                    for calls, period in self._limits
+                    if len(self._calls) >= calls
+                ),
+                default=0
+            )
+            if delay <= 0:
+                self._calls.append(now)
+                return
+            await asyncio.sleep(delay)
 
 
 class TelegramBot:
@@ -22,10 +74,22 @@ class TelegramBot:
     
     # Timeouts
     TIMEOUT = 10.0
-    MAX_RETRIES = 5
+    MAX_RETRIES = 4
+    
+    # Longest jittered exponential backoff between attempts (seconds)
+    MAX_BACKOFF = 30
+    
+    # Bot API limits: 30 messages/s overall, 20 messages/min to one group
+    RATE_LIMITS = ((30, 1.0), (20, 60.0))
+    MAX_CONCURRENT_SENDS = 5
     
-    # Backoff multiplier (seconds)
-    BACKOFF_MULTIPLIER = 5
+    # Kept-alive HTTP connections to the Bot API
+    CONNECTION_POOL_SIZE = 32
+    
+    # Bots (each owning an HTTP pool) and rate limiters, shared by all instances per token
+    _bots: Dict[str, Bot] = {}
+    _rate_limiters: Dict[str, RateLimiter] = {}
+    _open_counts: Dict[str, int] = {}
     
     def __init__(
         self,
@@ -34,16 +98,57 @@ class TelegramBot:
         max_description_length: int = 0
     ):
         """Initialize Telegram bot."""
-        request = HTTPXRequest(
-            connection_pool_size=8,
-            read_timeout=self.TIMEOUT,
-            write_timeout=self.TIMEOUT,
-            connect_timeout=self.TIMEOUT,
-            pool_timeout=self.TIMEOUT
-        )
-        self._bot = Bot(token=bot_token, request=request)
+        if bot_token not in self._bots:
+            request = HTTPXRequest(
+                connection_pool_size=self.CONNECTION_POOL_SIZE,
+                read_timeout=self.TIMEOUT,
+                write_timeout=self.TIMEOUT,
+                connect_timeout=self.TIMEOUT,
+                pool_timeout=self.TIMEOUT,
+                http_version="2"
+            )
+            self._bots[bot_token] = Bot(token=bot_token, request=request)
+            self._rate_limiters[bot_token] = RateLimiter(self.RATE_LIMITS)
+        
+        self._token = bot_token
+        self._bot = self._bots[bot_token]
         self._chat_id = chat_id
         self._max_description_length = max_description_length
+        self._rate_limiter = self._rate_limiters[bot_token]
+        self._send_slots = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        # Whether this instance holds one of the shared pool's open counts
+        self._initialized = False
+    
+    async def initialize(self) -> None:
+        """Open the bot's HTTP connection pool."""
+        await self._bot.initialize()
+        if not self._initialized:
+            self._initialized = True
+            self._open_counts[self._token] = self._open_counts.get(self._token, 0) + 1
+    
+    async def close(self) -> None:
+        """Close the bot's HTTP connection pool once no other instance uses it."""
+        if not self._initialized:
+            # Never opened the pool, so it isn't ours to shut down
+            return
+        self._initialized = False
+        
+        remaining = self._open_counts.pop(self._token, 0) - 1
+        if remaining > 0:
+            self._open_counts[self._token] = remaining
+            return
+        
+        if self._bots.get(self._token) is self._bot:
+            del self._bots[self._token]
+            del self._rate_limiters[self._token]
+        await self._bot.shutdown()
+    
+    async def __aenter__(self) -> "TelegramBot":
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
     
     @property
     def bot(self) -> Bot:
@@ -62,32 +167,16 @@ class TelegramBot:
     
     def _format_release_message(self, release: ReleaseProtocol) -> str:
         """Format release information as Telegram message."""
-        lines = [
-            f"🎵 <b>{self._escape_html(release.title)}</b>",
-            f"👤 <b>{self._escape_html(release.artist)}</b>",
-            "",
-        ]
-        
-        if release.tags:
-            tags_str = " ".join(
-                f"#{tag.replace(' ', '_').replace('-', '_')}" 
-                for tag in release.tags if tag
-            )
-            lines.append(f"🏷️ {tags_str}")
-            lines.append("")
-        
-        lines.append(f"🔗 <a href='{release.url}'>Open on Bandcamp</a>")
-        
-        return "\n".join(lines)
+        return _format_message(release.url, release.title, release.artist, release.hashtags)
     
     @staticmethod
     def _escape_html(text: str) -> str:
         """Escape HTML special characters."""
-        return (
-            text.replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-        )
+        return text.translate(_HTML_ESCAPE)
+    
+    def _backoff(self, attempt: int) -> float:
+        """Get jittered exponential delay before retrying given attempt."""
+        return min(self.MAX_BACKOFF, 2 ** attempt + random.random())
     
     async def _send_with_retry(
         self,
@@ -97,18 +186,31 @@ class TelegramBot:
         """Send message with retry logic."""
         for attempt in range(self.MAX_RETRIES):
             try:
-                await asyncio.wait_for(send_func(), timeout=self.TIMEOUT)
+                await self._rate_limiter.acquire()
+                # HTTPXRequest enforces connect/read/write/pool timeouts and raises TimedOut
+                await send_func()
                 return True
                 
-            except (TimedOut, NetworkError, asyncio.TimeoutError) as e:
-                wait_time = self.BACKOFF_MULTIPLIER * (attempt + 1)
+            except RetryAfter as e:
+                # Flood control: wait exactly as long as Telegram asks
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logger.warning(f"Flood limit sending {error_context}, retrying in {retry_after}s")
+                if attempt < self.MAX_RETRIES - 1:
+                    await asyncio.sleep(retry_after)
+                else:
+                    return False
+                
+            except (TimedOut, NetworkError) as e:
+                wait_time = self._backoff(attempt)
                 logger.warning(
                     f"Timeout sending {error_context} "
                     f"(attempt {attempt + 1}/{self.MAX_RETRIES}): {e}"
                 )
                 
                 if attempt < self.MAX_RETRIES - 1:
-                    logger.info(f"Waiting {wait_time}s before retry...")
+                    logger.info(f"Waiting {wait_time:.1f}s before retry...")
                     await asyncio.sleep(wait_time)
                 else:
                     logger.error(
@@ -123,7 +225,7 @@ class TelegramBot:
             except Exception as e:
                 logger.error(f"Unexpected error sending {error_context}: {e}")
                 if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(self.BACKOFF_MULTIPLIER * (attempt + 1))
+                    await asyncio.sleep(self._backoff(attempt))
                 else:
                     return False
         
@@ -151,6 +253,36 @@ class TelegramBot:
         
         return success
     
+    async def _send_release_limited(
+        self,
+        release: ReleaseProtocol,
+        on_sent: Optional[Callable[[ReleaseProtocol], Any]] = None
+    ) -> bool:
+        """Send a release while holding one of the concurrent send slots."""
+        async with self._send_slots:
+            sent = await self.send_release(release)
+        if sent and on_sent is not None:
+            on_sent(release)
+        return sent
+    
+    async def send_releases(
+        self,
+        releases: Iterable[ReleaseProtocol],
+        on_sent: Optional[Callable[[ReleaseProtocol], Any]] = None
+    ) -> List[bool]:
+        """Send releases concurrently. Returns success flag for each release, in order.
+        
+        If given, `on_sent` is called with each release as soon as it is delivered.
+        """
+        results = await asyncio.gather(
+            *(self._send_release_limited(release, on_sent) for release in releases),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Unexpected error sending release: {result}")
+        return [result is True for result in results]
+    
     async def send_message(self, text: str) -> bool:
         """Send plain text message."""
         async def send():